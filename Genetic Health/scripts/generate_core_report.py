@@ -10,6 +10,7 @@ EXCLUDES:
 Includes assertions to prevent contradictions with Deep Dive report.
 """
 
+import re
 from pathlib import Path
 
 
@@ -21,6 +22,24 @@ FORBIDDEN_CLINICAL_TERMS = [
     'cancer risk', 'tumor', 'malignant', 'diagnosis'
 ]
 
+# All forbidden terms as one pattern (longest first) so text is scanned once.
+# Terms must start at a word boundary ('unaffected' doesn't match 'affected')
+# but may continue, so plurals like 'mutations' and 'disorders' still match.
+_FORBIDDEN_CLINICAL_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(t) for t in sorted(FORBIDDEN_CLINICAL_TERMS, key=len, reverse=True)) + r')',
+    re.IGNORECASE,
+)
+
+
+def assert_no_clinical_terms(content: str):
+    """Assert Core Report contains none of FORBIDDEN_CLINICAL_TERMS."""
+    match = _FORBIDDEN_CLINICAL_RE.search(content)
+    if match:
+        raise ValueError(
+            f"VIOLATION: Core Report contains forbidden clinical term: '{match.group(0)}'. "
+            f"Clinical findings belong in the Deep Dive report."
+        )
+
 
 def sanitize_clinical_terms(content: str) -> str:
     """Remove or replace any forbidden clinical terms that slipped through filters."""
@@ -54,8 +73,8 @@ def _finding_contains_clinical_terms(finding: dict) -> bool:
         str(finding.get('summary', '')),
         str(finding.get('trait', '')),
         str(finding.get('annotation', '')),
-    ]).lower()
-    return any(term in text for term in FORBIDDEN_CLINICAL_TERMS)
+    ])
+    return _FORBIDDEN_CLINICAL_RE.search(text) is not None
 
 
 def filter_lifestyle_findings(findings: list) -> list:
@@ -170,7 +189,8 @@ def generate_core_report_markdown(results: dict, subject_name: str = None) -> st
 
     # 4. Pharmacogenomics (Level 1A/1B only, detailed format)
     if pharma_quick:
-        report_parts.append(generate_pharmgkb_report(pharma_quick))
+        # "Affected" is a forbidden Core term, so use a wellness-appropriate label
+        report_parts.append(generate_pharmgkb_report(pharma_quick, drugs_label="Relevant Drugs"))
 
     # 5. Action summary
     report_parts.append(generate_action_summary(lifestyle_findings))
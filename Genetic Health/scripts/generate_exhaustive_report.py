@@ -555,7 +555,7 @@ def generate_finding_section(finding, index):
     return "\n".join(section)
 
 
-def generate_pharmgkb_section(finding, index):
+def generate_pharmgkb_section(finding, index, drugs_label="Affected Drugs"):
     """Generate a comprehensive section for a PharmGKB drug interaction."""
     gene = finding.get('gene', 'Unknown')
     rsid = finding.get('rsid', '')
@@ -571,7 +571,7 @@ def generate_pharmgkb_section(finding, index):
     section.append(f"**Evidence Level:** {format_evidence_level(level)}  ")
     section.append(f"**Category:** {category}  ")
     section.append(f"**Your Genotype:** `{genotype}`  ")
-    section.append(f"**Affected Drugs:** {drugs}")
+    section.append(f"**{drugs_label}:** {drugs}")
     section.append("")
     section.append("#### Clinical Annotation")
     section.append(annotation)
@@ -752,8 +752,11 @@ def generate_full_findings(findings):
     return "\n".join(lines)
 
 
-def generate_pharmgkb_report(pharmgkb):
-    """Generate comprehensive pharmacogenomics section."""
+def generate_pharmgkb_report(pharmgkb, drugs_label="Affected Drugs"):
+    """Generate comprehensive pharmacogenomics section.
+
+    drugs_label is the heading shown before each entry's drug list.
+    """
     lines = []
     lines.append("## 💊 Pharmacogenomics - Complete Drug-Gene Interactions")
     lines.append("")
@@ -771,25 +774,25 @@ def generate_pharmgkb_report(pharmgkb):
         lines.append("### Level 1A - Highest Evidence (Clinical Guideline Annotations)")
         lines.append("")
         for i, finding in enumerate(level_1a, 1):
-            lines.append(generate_pharmgkb_section(finding, i))
+            lines.append(generate_pharmgkb_section(finding, i, drugs_label))
 
     if level_1b:
         lines.append("### Level 1B - High Evidence (Clinical Guideline Annotations)")
         lines.append("")
         for i, finding in enumerate(level_1b, 1):
-            lines.append(generate_pharmgkb_section(finding, i))
+            lines.append(generate_pharmgkb_section(finding, i, drugs_label))
 
     if level_2a:
         lines.append("### Level 2A - Moderate Evidence")
         lines.append("")
         for i, finding in enumerate(level_2a, 1):
-            lines.append(generate_pharmgkb_section(finding, i))
+            lines.append(generate_pharmgkb_section(finding, i, drugs_label))
 
     if level_2b:
         lines.append("### Level 2B - Moderate Evidence")
         lines.append("")
         for i, finding in enumerate(level_2b, 1):
-            lines.append(generate_pharmgkb_section(finding, i))
+            lines.append(generate_pharmgkb_section(finding, i, drugs_label))
 
     return "\n".join(lines)
 
@@ -1167,8 +1167,18 @@ It is NOT a clinical diagnosis or medical advice.
 # MAIN PIPELINE
 # =============================================================================
 
-def run_full_analysis(genome_path: Path = None, subject_name: str = None):
-    """Run the complete genetic analysis pipeline."""
+def run_full_analysis(genome_path: Path = None, subject_name: str = None,
+                      output_dir: Path = None):
+    """Run the complete genetic analysis pipeline.
+
+    Reports are written to output_dir (default: REPORTS_DIR).
+
+    Returns a dict with health_results, disease_findings, disease_stats and
+    results. results is the dict saved as comprehensive_results.json, but it
+    reflects state after report generation: generate_disease_risk_report adds
+    zygosity fields to disease findings and re-sorts some of their lists in
+    place, so it is not byte-for-byte what the JSON file contains.
+    """
 
     print_header("FULL GENETIC HEALTH ANALYSIS")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -1183,7 +1193,9 @@ def run_full_analysis(genome_path: Path = None, subject_name: str = None):
         sys.exit(1)
 
     # Create reports directory
-    REPORTS_DIR.mkdir(exist_ok=True)
+    if output_dir is None:
+        output_dir = REPORTS_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Load genome
     genome_by_rsid, genome_by_position = load_genome(genome_path)
@@ -1205,27 +1217,27 @@ def run_full_analysis(genome_path: Path = None, subject_name: str = None):
         'disease_findings': disease_findings,
         'disease_stats': disease_stats,
     }
-    intermediate_path = REPORTS_DIR / "comprehensive_results.json"
+    intermediate_path = output_dir / "comprehensive_results.json"
     with open(intermediate_path, 'w', encoding='utf-8') as f:
         json.dump(results_json, f, indent=2)
 
     # Generate exhaustive genetic report
-    genetic_report_path = REPORTS_DIR / "EXHAUSTIVE_GENETIC_REPORT.md"
+    genetic_report_path = output_dir / "EXHAUSTIVE_GENETIC_REPORT.md"
     generate_exhaustive_genetic_report(health_results, genetic_report_path, subject_name)
 
     # Generate disease risk report
     if disease_findings:
-        disease_report_path = REPORTS_DIR / "EXHAUSTIVE_DISEASE_RISK_REPORT.md"
+        disease_report_path = output_dir / "EXHAUSTIVE_DISEASE_RISK_REPORT.md"
         generate_disease_risk_report(disease_findings, disease_stats, len(genome_by_rsid),
                                       disease_report_path, subject_name)
 
     # Generate actionable protocol - use versioned filename
-    protocol_path = REPORTS_DIR / "ACTIONABLE_HEALTH_PROTOCOL_V3.md"
+    protocol_path = output_dir / "ACTIONABLE_HEALTH_PROTOCOL_V3.md"
     generate_actionable_protocol(health_results, disease_findings, protocol_path, subject_name)
 
     # Summary
     print_header("ANALYSIS COMPLETE")
-    print(f"\nReports generated in: {REPORTS_DIR}")
+    print(f"\nReports generated in: {output_dir}")
     print(f"\n  1. EXHAUSTIVE_GENETIC_REPORT.md")
     print(f"     - {len(health_results['findings'])} lifestyle/health findings")
     print(f"     - {len(health_results['pharmgkb_findings'])} drug-gene interactions")
@@ -1247,7 +1259,8 @@ def run_full_analysis(genome_path: Path = None, subject_name: str = None):
     return {
         'health_results': health_results,
         'disease_findings': disease_findings,
-        'disease_stats': disease_stats
+        'disease_stats': disease_stats,
+        'results': results_json,
     }
 
 
@@ -9,6 +9,7 @@ import time
 import traceback
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -20,6 +21,12 @@ from flask import Flask, jsonify, request, send_file, send_from_directory
 
 app = Flask(__name__)
 
+# Hard cap on request bodies. Werkzeug rejects oversized uploads from the
+# Content-Length header (413) before the multipart body is parsed.
+# Raw AncestryDNA/23andMe exports are ~15-20 MB uncompressed.
+MAX_UPLOAD_MB = 50
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_MB * 1024 * 1024
+
 # ---------------------------------------------------------------------------
 # Logging setup — writes to .logs/ directory at repo root
 # ---------------------------------------------------------------------------
@@ -66,13 +73,16 @@ BETA_SAVE_UPLOADS = True
 
 sys.path.insert(0, str(SCRIPTS_DIR))
 
-from run_full_analysis import REPORTS_DIR, run_full_analysis  # noqa: E402
+from run_full_analysis import run_full_analysis  # noqa: E402
 from generate_summary_report import generate_summary_report  # noqa: E402
 from generate_core_report import generate_core_report  # noqa: E402
 from generate_deep_dive_report import generate_deep_dive_report  # noqa: E402
 
 BASE_URL = os.environ.get("BASE_URL", "http://localhost:8000")
 
+# Stripe API key is read once at import instead of inside every payment handler.
+stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
+
 REPORT_NAMES = [
     "EXHAUSTIVE_GENETIC_REPORT.md",
     "EXHAUSTIVE_DISEASE_RISK_REPORT.md",
@@ -84,12 +94,28 @@ REPORT_NAMES = [
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Session deletion runs in the background so /api/analyze never waits on
+# unlink syscalls, and the directory scan itself is throttled.
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="session-cleanup")
+_CLEANUP_INTERVAL_S = 10 * 60
+_LAST_CLEANUP = 0.0
+
+
 def _cleanup_old_sessions(max_age_hours: int = 24) -> None:
-    """Delete session folders older than max_age_hours."""
-    cutoff = time.time() - max_age_hours * 3600
+    """Delete session folders older than max_age_hours.
+
+    Runs at most once per _CLEANUP_INTERVAL_S; deletions happen on _CLEANUP_POOL.
+    """
+    global _LAST_CLEANUP
+    now = time.time()
+    if now - _LAST_CLEANUP < _CLEANUP_INTERVAL_S:
+        return
+    _LAST_CLEANUP = now
+
+    cutoff = now - max_age_hours * 3600
     for folder in SESSIONS_DIR.iterdir():
         if folder.is_dir() and folder.stat().st_mtime < cutoff:
-            shutil.rmtree(folder, ignore_errors=True)
+            _CLEANUP_POOL.submit(shutil.rmtree, folder, ignore_errors=True)
 
 
 def _build_teasers(results: dict) -> list[dict]:
@@ -276,7 +302,7 @@ def _extract_genome_from_zip(zip_path: Path, dest_dir: Path) -> Path:
 
         extracted_path = dest_dir / Path(best).name
         with zf.open(best) as src, open(extracted_path, 'wb') as dst:
-            dst.write(src.read())
+            shutil.copyfileobj(src, dst, length=1 << 20)
 
     return extracted_path
 
@@ -295,6 +321,12 @@ def logo():
     return send_from_directory(REPO_ROOT, 'logo.svg')
 
 
+@app.errorhandler(413)
+def upload_too_large(_e):
+    logger.warning(f"Rejected upload over {MAX_UPLOAD_MB} MB (Content-Length={request.content_length})")
+    return jsonify({'error': f'File too large (max {MAX_UPLOAD_MB} MB)'}), 413
+
+
 @app.post('/api/analyze')
 def analyze():
     _cleanup_old_sessions()
@@ -321,9 +353,9 @@ def analyze():
     try:
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
-            ext = Path(uploaded.filename).suffix.lower() or '.txt'
+            ext = os.path.splitext(uploaded.filename)[1].lower() or '.txt'
             raw_path = tmp_path / f'raw_upload{ext}'
-            uploaded.save(raw_path)
+            uploaded.save(raw_path, buffer_size=1 << 20)
 
             file_size = raw_path.stat().st_size
             logger.info(f"  Saved upload: {raw_path.name} ({file_size:,} bytes, ext={ext})")
@@ -342,7 +374,11 @@ def analyze():
                 logger.info(f"  Extracted from ZIP: {genome_path.name} ({genome_path.stat().st_size:,} bytes)")
 
             t0 = time.time()
-            run_full_analysis(genome_path=genome_path, subject_name=subject_name)
+            analysis = run_full_analysis(
+                genome_path=genome_path,
+                subject_name=subject_name,
+                output_dir=session_dir,
+            )
             elapsed = time.time() - t0
             logger.info(f"  Analysis completed in {elapsed:.1f}s")
 
@@ -351,24 +387,18 @@ def analyze():
         logger.debug(traceback.format_exc())
         return jsonify({'error': f'Analysis failed: {e}'}), 500
 
-    # Copy reports and JSON into persistent session folder
-    results_json_path = REPORTS_DIR / "comprehensive_results.json"
+    # Reports and JSON are written straight into the persistent session folder
+    results_json_path = session_dir / "comprehensive_results.json"
     if not results_json_path.exists():
         logger.error(f"  No results JSON produced for {analysis_id}")
         return jsonify({'error': 'Analysis produced no results'}), 500
 
-    shutil.copy(results_json_path, session_dir / "comprehensive_results.json")
-    for name in REPORT_NAMES:
-        src = REPORTS_DIR / name
-        if src.exists():
-            shutil.copy(src, session_dir / name)
-
     # Store subject name alongside session data
     if subject_name:
         (session_dir / "subject_name.txt").write_text(subject_name, encoding='utf-8')
 
-    # Build teaser response
-    results = json.loads(results_json_path.read_text(encoding='utf-8'))
+    # Build teaser response from the in-memory results (no need to re-parse the JSON)
+    results = analysis['results']
     teasers = _build_teasers(results)
     summary = results.get("summary", {})
     disease_stats = results.get("disease_stats", {})
@@ -415,7 +445,6 @@ def checkout():
     if not analysis_id or not session_dir.exists():
         return jsonify({'error': 'Invalid or expired analysis session'}), 400
 
-    stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
     if not stripe.api_key:
         return jsonify({'error': 'Payment not configured'}), 503
 
@@ -490,7 +519,6 @@ def checkout_core():
     if not analysis_id or not session_dir.exists():
         return jsonify({'error': 'Invalid or expired analysis session'}), 400
 
-    stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
     if not stripe.api_key:
         return jsonify({'error': 'Payment not configured'}), 503
 
@@ -538,7 +566,6 @@ def checkout_deep_dive():
     if not analysis_id or not session_dir.exists():
         return jsonify({'error': 'Invalid or expired analysis session'}), 400
 
-    stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
     if not stripe.api_key:
         return jsonify({'error': 'Payment not configured'}), 503
 
@@ -615,7 +642,6 @@ def complete_core():
         return jsonify({'error': 'Invalid or expired analysis session'}), 400
 
     # Verify payment with Stripe
-    stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
     subject_name = None
     if stripe.api_key:
         try:
@@ -652,7 +678,7 @@ def complete_core():
 
     # Build ZIP with Core Report only (MD + HTML)
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
         zf.write(core_md_path, arcname="DNA_DECODER_CORE_REPORT.md")
         zf.write(core_html_path, arcname="DNA_DECODER_CORE_REPORT.html")
 
@@ -750,7 +776,6 @@ def complete():
         return jsonify({'error': 'Invalid or expired analysis session'}), 400
 
     # Verify payment with Stripe
-    stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
     if stripe.api_key:
         try:
             stripe_session = stripe.checkout.Session.retrieve(session_id)
@@ -829,7 +854,7 @@ def complete():
 
     # Build ZIP of Deep Dive package (includes Core + Deep Dive + legacy reports)
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
         # Add new two-tier reports
         if core_md_path.exists():
             zf.write(core_md_path, arcname="DNA_DECODER_CORE_REPORT.md")
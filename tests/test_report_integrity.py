@@ -6,6 +6,7 @@ Tests that Core and Deep Dive reports maintain proper separation
 and don't create contradictions.
 """
 
+import functools
 import sys
 from pathlib import Path
 
@@ -17,27 +18,54 @@ from generate_core_report import generate_core_report, assert_no_clinical_terms
 from generate_deep_dive_report import generate_deep_dive_report, assert_proper_clinical_framing
 
 
+# One Core Report covering both the clinical-terms and lifestyle-only checks:
+# lifestyle (CYP1A2) + disease (BRCA1) findings and a Level 1A drug interaction.
+_SAMPLE_CORE = {
+    'findings': [
+        {'gene': 'CYP1A2', 'trait': 'Caffeine metabolism', 'genotype': 'AC', 'magnitude': 3,
+         'summary': 'Slow caffeine metabolizer', 'category': 'Metabolism'},
+        {'gene': 'BRCA1', 'trait': 'Breast cancer risk', 'genotype': 'AG', 'magnitude': 5,
+         'summary': 'Disease risk', 'category': 'Disease Risk'},  # Should be excluded
+    ],
+    'pharmgkb_findings': [
+        {'drugs': 'Warfarin', 'gene': 'CYP2C9', 'level': '1A', 'phenotype': 'Normal', 'annotation': 'Standard dosing'}
+    ]
+}
+
+_SAMPLE_LIFESTYLE = {
+    'findings': [{'gene': 'CYP1A2', 'trait': 'Caffeine metabolism', 'category': 'Metabolism'}],
+    'pharmgkb_findings': []
+}
+
+_SAMPLE_DISEASE = {
+    'pathogenic': [
+        {'gene': 'BRCA1', 'rsid': 'rs80357906', 'chromosome': '17', 'position': '43094692',
+         'user_genotype': 'AG', 'traits': 'Breast cancer', 'gold_stars': 4, 'is_homozygous': False,
+         'significance': 'pathogenic'}
+    ],
+    'likely_pathogenic': []
+}
+
+_SAMPLE_PHARMGKB_LEVELS = {
+    'findings': [],
+    'pharmgkb_findings': [
+        {'drugs': 'Warfarin', 'gene': 'CYP2C9', 'level': '1A', 'phenotype': 'Normal', 'annotation': 'Standard'},
+        {'drugs': 'Simvastatin', 'gene': 'SLCO1B1', 'level': '2A', 'phenotype': 'Reduced', 'annotation': 'Lower dose'},
+    ]
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _core_report():
+    """Generate the shared sample Core Report on first use and reuse it."""
+    return generate_core_report(_SAMPLE_CORE)
+
+
 def test_core_excludes_clinical_terms():
     """Core Report must NOT contain forbidden clinical terms."""
-    sample_results = {
-        'findings': [
-            {'gene': 'CYP1A2', 'trait': 'Caffeine metabolism', 'genotype': 'AC', 'magnitude': 3,
-             'summary': 'Slow caffeine metabolizer', 'category': 'Metabolism'}
-        ],
-        'pharmgkb_findings': [
-            {'drug': 'Warfarin', 'gene': 'CYP2C9', 'level': '1A', 'phenotype': 'Normal', 'annotation': 'Standard dosing'}
-        ]
-    }
-
-    core_md, core_html = generate_core_report(sample_results)
-
-    # Should not contain clinical terms
-    assert 'pathogenic' not in core_md.lower()
-    assert 'pathogenic' not in core_html.lower()
-    assert 'disease causing' not in core_md.lower()
-    assert 'affected' not in core_md.lower()
-
-    # Should pass assertion
+    core_md, core_html = _core_report()
+
+    # Should not contain clinical terms (pathogenic, disease causing, affected, ...)
     assert_no_clinical_terms(core_md)
     assert_no_clinical_terms(core_html)
 
@@ -46,46 +74,23 @@ def test_core_excludes_clinical_terms():
 
 def test_deep_dive_proper_framing():
     """Deep Dive must use non-diagnostic language."""
-    sample_results = {
-        'findings': [{'gene': 'CYP1A2', 'trait': 'Caffeine metabolism', 'category': 'Metabolism'}],
-        'pharmgkb_findings': []
-    }
-
-    sample_disease = {
-        'pathogenic': [
-            {'gene': 'BRCA1', 'rsid': 'rs80357906', 'chromosome': '17', 'position': '43094692',
-             'user_genotype': 'AG', 'traits': 'Breast cancer', 'gold_stars': 4, 'is_homozygous': False,
-             'significance': 'pathogenic'}
-        ],
-        'likely_pathogenic': []
-    }
-
-    deep_dive_md, deep_dive_html = generate_deep_dive_report(sample_results, sample_disease)
+    deep_dive_md, deep_dive_html = generate_deep_dive_report(_SAMPLE_LIFESTYLE, _SAMPLE_DISEASE)
 
     # Should include pathogenic findings
     assert 'BRCA1' in deep_dive_md
-    assert 'pathogenic' in deep_dive_md.lower() or 'flagged' in deep_dive_md.lower()
+    dd_lc = deep_dive_md.lower()
+    assert 'pathogenic' in dd_lc or 'flagged' in dd_lc
 
     # Should NOT make definitive diagnostic claims
-    assert 'you are diagnosed with breast cancer' not in deep_dive_md.lower()
-    assert 'this confirms you have breast cancer' not in deep_dive_md.lower()
+    assert 'you are diagnosed with breast cancer' not in dd_lc
+    assert 'this confirms you have breast cancer' not in dd_lc
 
     print("[PASS] Deep Dive uses proper non-diagnostic framing")
 
 
 def test_core_only_lifestyle_genetics():
     """Core Report should only include lifestyle findings."""
-    sample_results = {
-        'findings': [
-            {'gene': 'CYP1A2', 'trait': 'Caffeine metabolism', 'genotype': 'AC', 'magnitude': 3,
-             'summary': 'Slow caffeine metabolizer', 'category': 'Metabolism'},
-            {'gene': 'BRCA1', 'trait': 'Breast cancer risk', 'genotype': 'AG', 'magnitude': 5,
-             'summary': 'Disease risk', 'category': 'Disease Risk'},  # Should be excluded
-        ],
-        'pharmgkb_findings': []
-    }
-
-    core_md, core_html = generate_core_report(sample_results)
+    core_md, _ = _core_report()
 
     # Should include lifestyle
     assert 'CYP1A2' in core_md
@@ -100,16 +105,8 @@ def test_core_only_lifestyle_genetics():
 
 def test_pharmgkb_level_filtering():
     """Core should only show Level 1A/1B PharmGKB, Deep Dive shows all."""
-    sample_results = {
-        'findings': [],
-        'pharmgkb_findings': [
-            {'drug': 'Warfarin', 'gene': 'CYP2C9', 'level': '1A', 'phenotype': 'Normal', 'annotation': 'Standard'},
-            {'drug': 'Simvastatin', 'gene': 'SLCO1B1', 'level': '2A', 'phenotype': 'Reduced', 'annotation': 'Lower dose'},
-        ]
-    }
-
-    core_md, _ = generate_core_report(sample_results)
-    deep_dive_md, _ = generate_deep_dive_report(sample_results, {})
+    core_md, _ = generate_core_report(_SAMPLE_PHARMGKB_LEVELS)
+    deep_dive_md, _ = generate_deep_dive_report(_SAMPLE_PHARMGKB_LEVELS, {})
 
     # Core should have Level 1A only
     assert 'Warfarin' in core_md
@@ -122,32 +119,49 @@ def test_pharmgkb_level_filtering():
     print("[PASS] PharmGKB filtering works correctly")
 
 
+ALL_TESTS = [
+    test_core_excludes_clinical_terms,
+    test_deep_dive_proper_framing,
+    test_core_only_lifestyle_genetics,
+    test_pharmgkb_level_filtering,
+]
+
+
+def _run_one(test_fn):
+    """Run a single test, returning (name, passed, message)."""
+    try:
+        test_fn()
+    except AssertionError as e:
+        return test_fn.__name__, False, f"Test failed: {e}"
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return test_fn.__name__, False, f"Error: {e}"
+    return test_fn.__name__, True, ""
+
+
 def run_all_tests():
     """Run all integrity tests."""
     print("\n" + "="*60)
     print("Running Report Integrity Tests")
     print("="*60 + "\n")
 
-    try:
-        test_core_excludes_clinical_terms()
-        test_deep_dive_proper_framing()
-        test_core_only_lifestyle_genetics()
-        test_pharmgkb_level_filtering()
-
-        print("\n" + "="*60)
-        print("[PASS] All tests passed!")
-        print("="*60 + "\n")
-        return 0
+    # The tests are independent and each takes milliseconds, so they run
+    # sequentially; every test runs even if an earlier one fails.
+    results = [_run_one(fn) for fn in ALL_TESTS]
+    failures = [(name, msg) for name, ok, msg in results if not ok]
 
-    except AssertionError as e:
-        print(f"\n[FAIL] Test failed: {e}\n")
-        return 1
-    except Exception as e:
-        print(f"\n[FAIL] Error: {e}\n")
-        import traceback
-        traceback.print_exc()
+    if failures:
+        for name, msg in failures:
+            print(f"\n[FAIL] {name}: {msg}")
+        print(f"\n{len(failures)} of {len(results)} tests failed\n")
         return 1
 
+    print("\n" + "="*60)
+    print("[PASS] All tests passed!")
+    print("="*60 + "\n")
+    return 0
+
 
 if __name__ == '__main__':
     sys.exit(run_all_tests())